@@ -1526,6 +1526,7 @@ class SampleCollection(object):
         batch_size=None,
         num_workers=None,
         skip_failures=True,
+        prefetch_factor=None,
         **trainer_kwargs,
     ):
         """Applies the :class:`FiftyOne model <fiftyone.core.models.Model>` or
@@ -1563,6 +1564,10 @@ class SampleCollection(object):
                 raising an error if predictions cannot be generated for a
                 sample. Only applicable to :class:`fiftyone.core.models.Model`
                 instances
+            prefetch_factor (None): the number of batches that each worker
+                loads in advance when loading images. Only applicable for
+                Torch-based :class:`fiftyone.core.models.Model` instances. By
+                default, 4 batches are prefetched per worker
             **trainer_kwargs: optional keyword arguments used to initialize the
                 :mod:`Trainer <flash:flash.core.trainer>` when using Flash
                 models. These can be used to, for example, configure the number
@@ -1577,6 +1582,7 @@ class SampleCollection(object):
             batch_size=batch_size,
             num_workers=num_workers,
             skip_failures=skip_failures,
+            prefetch_factor=prefetch_factor,
             **trainer_kwargs,
         )
 
@@ -1587,6 +1593,7 @@ class SampleCollection(object):
         batch_size=None,
         num_workers=None,
         skip_failures=True,
+        prefetch_factor=None,
         **trainer_kwargs,
     ):
         """Computes embeddings for the samples in the collection using the
@@ -1626,6 +1633,10 @@ class SampleCollection(object):
                 raising an error if embeddings cannot be generated for a
                 sample. Only applicable to :class:`fiftyone.core.models.Model`
                 instances
+            prefetch_factor (None): the number of batches that each worker
+                loads in advance when loading images. Only applicable for
+                Torch-based :class:`fiftyone.core.models.Model` instances. By
+                default, 4 batches are prefetched per worker
             **trainer_kwargs: optional keyword arguments used to initialize the
                 :mod:`Trainer <flash:flash.core.trainer>` when using Flash
                 models. These can be used to, for example, configure the number
@@ -1657,6 +1668,7 @@ class SampleCollection(object):
             batch_size=batch_size,
             num_workers=num_workers,
             skip_failures=skip_failures,
+            prefetch_factor=prefetch_factor,
             **trainer_kwargs,
         )
 
@@ -1671,6 +1683,7 @@ class SampleCollection(object):
         batch_size=None,
         num_workers=None,
         skip_failures=True,
+        prefetch_factor=None,
     ):
         """Computes embeddings for the image patches defined by
         ``patches_field`` of the samples in the collection using the given
@@ -1723,6 +1736,10 @@ class SampleCollection(object):
                 applicable for Torch-based models
             skip_failures (True): whether to gracefully continue without
                 raising an error if embeddings cannot be generated for a sample
+            prefetch_factor (None): the number of batches that each worker
+                loads in advance when loading images. Only applicable for
+                Torch-based models. By default, 4 batches are prefetched per
+                worker
 
         Returns:
             one of the following:
@@ -1753,6 +1770,7 @@ class SampleCollection(object):
             alpha=alpha,
             handle_missing=handle_missing,
             skip_failures=skip_failures,
+            prefetch_factor=prefetch_factor,
         )
 
     def evaluate_regressions(
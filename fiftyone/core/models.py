@@ -5,6 +5,7 @@ FiftyOne models.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import namedtuple
 import contextlib
 import inspect
 import logging
@@ -53,6 +54,7 @@ def apply_model(
     batch_size=None,
     num_workers=None,
     skip_failures=True,
+    prefetch_factor=None,
     **trainer_kwargs,
 ):
     """Applies the :class:`FiftyOne model <Model>` or
@@ -85,6 +87,10 @@ def apply_model(
         skip_failures (True): whether to gracefully continue without raising an
             error if predictions cannot be generated for a sample. Only
             applicable to :class:`Model` instances
+        prefetch_factor (None): the number of batches that each worker loads
+            in advance when loading images. Only applicable for Torch-based
+            :class:`Model` instances. By default, 4 batches are prefetched per
+            worker
         **trainer_kwargs: optional keyword arguments used to initialize the
             :mod:`Trainer <flash:flash.core.trainer>` when using Flash models.
             These can be used to, for example, configure the number of GPUs to
@@ -132,6 +138,12 @@ def apply_model(
             "Ignoring `num_workers` parameter; only supported for Torch models"
         )
 
+    if prefetch_factor is not None and not use_data_loader:
+        logger.warning(
+            "Ignoring `prefetch_factor` parameter; only supported for Torch "
+            "models"
+        )
+
     if samples.media_type == fom.IMAGE:
         fov.validate_image_collection(samples)
 
@@ -192,6 +204,7 @@ def apply_model(
                 confidence_thresh,
                 batch_size,
                 num_workers,
+                prefetch_factor,
                 skip_failures,
             )
 
@@ -282,12 +295,18 @@ def _apply_image_model_data_loader(
     confidence_thresh,
     batch_size,
     num_workers,
+    prefetch_factor,
     skip_failures,
 ):
     samples = samples.select_fields()
     samples_loader = fou.iter_batches(samples, batch_size)
     data_loader = _make_data_loader(
-        samples, model, batch_size, num_workers, skip_failures
+        samples,
+        model,
+        batch_size,
+        num_workers,
+        prefetch_factor,
+        skip_failures,
     )
 
     with fou.ProgressBar(samples) as pb:
@@ -458,19 +477,31 @@ def _iter_batches(video_reader, batch_size):
         yield frame_numbers, imgs
 
 
-def _make_data_loader(samples, model, batch_size, num_workers, skip_failures):
+def _make_data_loader(
+    samples, model, batch_size, num_workers, prefetch_factor, skip_failures
+):
     # This function supports DataLoaders that emit numpy arrays that can
     # therefore be used for non-Torch models; but we do not currenly use this
     # functionality
     use_numpy = not isinstance(model, TorchModelMixin)
 
+    # Page-locked host memory allows asynchronous host-to-device copies
+    pin_memory = not use_numpy and getattr(model, "using_gpu", False)
+
     if num_workers is None:
-        num_workers = fout.recommend_num_workers()
+        num_workers = fout.recommend_num_workers(pin_memory=pin_memory)
+
+    # Decode images directly into tensors rather than PIL images when the
+    # model's transforms support it
+    use_tensors = not use_numpy and getattr(
+        model, "transforms_accept_tensors", False
+    )
 
     dataset = fout.TorchImageDataset(
         samples=samples,
         transform=model.transforms,
         use_numpy=use_numpy,
+        use_tensors=use_tensors,
         force_rgb=True,
         skip_failures=skip_failures,
     )
@@ -533,6 +564,8 @@ def _make_data_loader(samples, model, batch_size, num_workers, skip_failures):
         batch_size=batch_size,
         num_workers=num_workers,
         collate_fn=collate_fn,
+        pin_memory=pin_memory,
+        **_get_prefetch_kwargs(num_workers, prefetch_factor),
     )
 
 
@@ -543,6 +576,7 @@ def compute_embeddings(
     batch_size=None,
     num_workers=None,
     skip_failures=True,
+    prefetch_factor=None,
     **trainer_kwargs,
 ):
     """Computes embeddings for the samples in the collection using the given
@@ -579,6 +613,10 @@ def compute_embeddings(
         skip_failures (True): whether to gracefully continue without raising an
             error if embeddings cannot be generated for a sample. Only
             applicable to :class:`Model` instances
+        prefetch_factor (None): the number of batches that each worker loads
+            in advance when loading images. Only applicable for Torch-based
+            :class:`Model` instances. By default, 4 batches are prefetched per
+            worker
         **trainer_kwargs: optional keyword arguments used to initialize the
             :mod:`Trainer <flash:flash.core.trainer>` when using Flash models.
             These can be used to, for example, configure the number of GPUs to
@@ -642,6 +680,12 @@ def compute_embeddings(
             "Ignoring `num_workers` parameter; only supported for Torch models"
         )
 
+    if prefetch_factor is not None and not use_data_loader:
+        logger.warning(
+            "Ignoring `prefetch_factor` parameter; only supported for Torch "
+            "models"
+        )
+
     if samples.media_type == fom.IMAGE:
         fov.validate_image_collection(samples)
 
@@ -682,6 +726,7 @@ def compute_embeddings(
                 embeddings_field,
                 batch_size,
                 num_workers,
+                prefetch_factor,
                 skip_failures,
             )
 
@@ -704,7 +749,7 @@ def _compute_image_embeddings_single(
     errors = False
 
     with fou.ProgressBar() as pb:
-        for sample in pb(samples):
+        for sample in pb(_iter_samples(samples, embeddings_field)):
             embedding = None
 
             try:
@@ -736,7 +781,9 @@ def _compute_image_embeddings_batch(
     samples, model, embeddings_field, batch_size, skip_failures
 ):
     samples = samples.select_fields()
-    samples_loader = fou.iter_batches(samples, batch_size)
+    samples_loader = fou.iter_batches(
+        _iter_samples(samples, embeddings_field), batch_size
+    )
 
     embeddings = []
     errors = False
@@ -779,12 +826,25 @@ def _compute_image_embeddings_batch(
 
 
 def _compute_image_embeddings_data_loader(
-    samples, model, embeddings_field, batch_size, num_workers, skip_failures
+    samples,
+    model,
+    embeddings_field,
+    batch_size,
+    num_workers,
+    prefetch_factor,
+    skip_failures,
 ):
     samples = samples.select_fields()
-    samples_loader = fou.iter_batches(samples, batch_size)
+    samples_loader = fou.iter_batches(
+        _iter_samples(samples, embeddings_field), batch_size
+    )
     data_loader = _make_data_loader(
-        samples, model, batch_size, num_workers, skip_failures
+        samples,
+        model,
+        batch_size,
+        num_workers,
+        prefetch_factor,
+        skip_failures,
     )
 
     embeddings = []
@@ -829,6 +889,20 @@ def _compute_image_embeddings_data_loader(
     return np.stack(embeddings)
 
 
+_SampleInfo = namedtuple("_SampleInfo", ["id", "filepath"])
+
+
+def _iter_samples(samples, embeddings_field):
+    if embeddings_field:
+        return samples
+
+    # When embeddings are not being stored, only the IDs and filepaths of the
+    # samples are needed, so we load them in bulk rather than loading full
+    # `Sample` objects
+    ids, filepaths = samples.values(["id", "filepath"])
+    return [_SampleInfo(*args) for args in zip(ids, filepaths)]
+
+
 def _compute_frame_embeddings_single(
     samples, model, embeddings_field, skip_failures
 ):
@@ -1003,6 +1077,7 @@ def compute_patch_embeddings(
     batch_size=None,
     num_workers=None,
     skip_failures=True,
+    prefetch_factor=None,
 ):
     """Computes embeddings for the image patches defined by ``patches_field``
     of the samples in the collection using the given :class:`Model`.
@@ -1054,6 +1129,9 @@ def compute_patch_embeddings(
             Only applicable for Torch models
         skip_failures (True): whether to gracefully continue without raising an
             error if embeddings cannot be generated for a sample
+        prefetch_factor (None): the number of batches that each worker loads
+            in advance when loading images. Only applicable for Torch
+            models. By default, 4 batches are prefetched per worker
 
     Returns:
         one of the following:
@@ -1105,6 +1183,12 @@ def compute_patch_embeddings(
             "Ignoring `num_workers` parameter; only supported for Torch models"
         )
 
+    if prefetch_factor is not None and not use_data_loader:
+        logger.warning(
+            "Ignoring `prefetch_factor` parameter; only supported for Torch "
+            "models"
+        )
+
     if samples.media_type == fom.VIDEO:
         patches_field, _ = samples._handle_frame_field(patches_field)
         if embeddings_field is not None:
@@ -1155,6 +1239,7 @@ def compute_patch_embeddings(
                 handle_missing,
                 batch_size,
                 num_workers,
+                prefetch_factor,
                 skip_failures,
             )
 
@@ -1269,6 +1354,7 @@ def _embed_patches_data_loader(
     handle_missing,
     batch_size,
     num_workers,
+    prefetch_factor,
     skip_failures,
 ):
     samples = samples.select_fields(patches_field)
@@ -1280,6 +1366,7 @@ def _embed_patches_data_loader(
         alpha,
         handle_missing,
         num_workers,
+        prefetch_factor,
         skip_failures,
     )
 
@@ -1407,6 +1494,7 @@ def _make_patch_data_loader(
     alpha,
     handle_missing,
     num_workers,
+    prefetch_factor,
     skip_failures,
 ):
     # This function supports DataLoaders that emit numpy arrays that can
@@ -1414,8 +1502,17 @@ def _make_patch_data_loader(
     # functionality
     use_numpy = not isinstance(model, TorchModelMixin)
 
+    # Page-locked host memory allows asynchronous host-to-device copies
+    pin_memory = not use_numpy and getattr(model, "using_gpu", False)
+
     if num_workers is None:
-        num_workers = fout.recommend_num_workers()
+        num_workers = fout.recommend_num_workers(pin_memory=pin_memory)
+
+    # Pass patches as tensors rather than PIL images when the model's
+    # transforms support it
+    use_tensors = not use_numpy and getattr(
+        model, "transforms_accept_tensors", False
+    )
 
     dataset = fout.TorchImagePatchesDataset(
         samples=samples,
@@ -1424,6 +1521,7 @@ def _make_patch_data_loader(
         transform=model.transforms,
         ragged_batches=model.ragged_batches,
         use_numpy=use_numpy,
+        use_tensors=use_tensors,
         force_rgb=True,
         force_square=force_square,
         alpha=alpha,
@@ -1435,9 +1533,23 @@ def _make_patch_data_loader(
         batch_size=1,
         num_workers=num_workers,
         collate_fn=lambda batch: batch[0],  # return patches directly
+        pin_memory=pin_memory,
+        **_get_prefetch_kwargs(num_workers, prefetch_factor),
     )
 
 
+def _get_prefetch_kwargs(num_workers, prefetch_factor):
+    if not num_workers:
+        return {}
+
+    if prefetch_factor is None:
+        # Keep more batches in flight than the default of 2 per worker to
+        # better hide image decoding latency
+        prefetch_factor = 4
+
+    return {"prefetch_factor": prefetch_factor}
+
+
 def _parse_batch_size(batch_size, model, use_data_loader):
     if batch_size is None:
         batch_size = fo.config.default_batch_size
@@ -5,6 +5,7 @@ PyTorch utilities.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import inspect
 import logging
 import itertools
 import multiprocessing
@@ -14,7 +15,6 @@ import cv2
 import numpy as np
 from PIL import Image
 
-import eta.core.geometry as etag
 import eta.core.image as etai
 import eta.core.learning as etal
 import eta.core.utils as etau
@@ -131,11 +131,26 @@ class TorchImageModelConfig(foc.Config):
             inputs that are lists of Tensors
         embeddings_layer (None): the name of a layer whose output to expose as
             embeddings. Prepend ``"<"`` to save the input tensor instead
-        use_half_precision (None): whether to use half precision (only
-            supported when using GPU)
+        use_half_precision (None): whether to use half precision via
+            automatic mixed precision (only supported when using GPU)
+        use_int8_quantization (None): whether to apply dynamic int8
+            quantization to the ``Linear`` and ``LSTM`` layers of the model
+            via :func:`torch:torch.quantization.quantize_dynamic` (only
+            supported when using CPU). Convolutional layers are not affected;
+            use static quantization, eg via
+            :mod:`torch:torch.ao.quantization.quantize_fx`, for those
         cudnn_benchmark (None): a value to use for
             :attr:`torch:torch.backends.cudnn.benchmark` while the model is
             running
+        use_torchscript (None): whether to compile the model via
+            :func:`torch:torch.jit.script` and optimize it for inference. The
+            model must be scriptable and return the same outputs when
+            scripted. Not compatible with ``embeddings_layer``
+        use_cuda_graphs (None): whether to capture the model's forward pass in
+            a CUDA graph and replay it for subsequent batches of the same
+            shape (only supported when using GPU). The model must have static
+            output shapes and no host synchronization, eg, classifiers. Not
+            compatible with ``embeddings_layer``
     """
 
     def __init__(self, d):
@@ -178,9 +193,18 @@ class TorchImageModelConfig(foc.Config):
         self.use_half_precision = self.parse_bool(
             d, "use_half_precision", default=None
         )
+        self.use_int8_quantization = self.parse_bool(
+            d, "use_int8_quantization", default=None
+        )
         self.cudnn_benchmark = self.parse_bool(
             d, "cudnn_benchmark", default=None
         )
+        self.use_torchscript = self.parse_bool(
+            d, "use_torchscript", default=None
+        )
+        self.use_cuda_graphs = self.parse_bool(
+            d, "use_cuda_graphs", default=None
+        )
 
 
 class TorchImageModel(
@@ -209,15 +233,30 @@ class TorchImageModel(
         self._transforms = transforms
         self._preprocess = True
 
+        # The transforms built by this class accept uint8 tensors with
+        # arbitrary leading dimensions, so images can be decoded directly into
+        # tensors and same-size images can be transformed in batch. Subclasses
+        # that override `_build_transforms()` may require PIL images
+        self._transforms_accept_tensors = (
+            type(self)._build_transforms is TorchImageModel._build_transforms
+        )
+
         # Load model
         self._using_gpu = torch.cuda.is_available()
         self._device = torch.device("cuda:0" if self._using_gpu else "cpu")
         self._using_half_precision = (
             self.config.use_half_precision is True
         ) and self._using_gpu
+        self._using_int8_quantization = (
+            self.config.use_int8_quantization is True
+        ) and not self._using_gpu
+        self._using_cuda_graphs = self._use_cuda_graphs(config)
         self._model = self._load_model(config)
-        self._no_grad = None
+        self._normalize = self._build_normalize(config).to(self._device)
+        self._inference_mode = None
         self._benchmark_orig = None
+        self._cuda_graph = None
+        self._cuda_graph_key = None
 
         fom.LogitsMixin.__init__(self)
         TorchEmbeddingsMixin.__init__(
@@ -232,8 +271,8 @@ class TorchImageModel(
             self._benchmark_orig = torch.backends.cudnn.benchmark
             torch.backends.cudnn.benchmark = self.config.cudnn_benchmark
 
-        self._no_grad = torch.no_grad()
-        self._no_grad.__enter__()
+        self._inference_mode = _inference_mode()
+        self._inference_mode.__enter__()
         return self
 
     def __exit__(self, *args):
@@ -241,8 +280,8 @@ class TorchImageModel(
             torch.backends.cudnn.benchmark = self._benchmark_orig
             self._benchmark_orig = None
 
-        self._no_grad.__exit__(*args)
-        self._no_grad = None
+        self._inference_mode.__exit__(*args)
+        self._inference_mode = None
 
     @property
     def media_type(self):
@@ -267,9 +306,19 @@ class TorchImageModel(
         """The
         `torchvision.transforms <https://pytorch.org/vision/stable/transforms.html>`_
         function that will/must be applied to each input before prediction.
+
+        These transforms emit uint8 Torch tensors (CHW). Conversion to float
+        and normalization are performed in batch on the model's device.
         """
         return self._transforms
 
+    @property
+    def transforms_accept_tensors(self):
+        """Whether :meth:`transforms` accept uint8 Torch tensors (CHW) in
+        addition to PIL images and numpy arrays.
+        """
+        return self._transforms_accept_tensors
+
     @property
     def preprocess(self):
         """Whether to apply preprocessing transforms during inference."""
@@ -294,6 +343,11 @@ class TorchImageModel(
         """Whether the model is using half precision."""
         return self._using_half_precision
 
+    @property
+    def using_int8_quantization(self):
+        """Whether the model is using dynamic int8 quantization."""
+        return self._using_int8_quantization
+
     @property
     def num_classes(self):
         """The number of classes for the model."""
@@ -339,6 +393,11 @@ class TorchImageModel(
                 - A uint8 numpy tensor (NHWC)
                 - A Torch tensor (NCHW)
 
+            Floating point inputs are assumed to be in ``[0, 1]``. When
+            :meth:`preprocess` is False, uint8 Torch tensors are converted to
+            float and normalized on the model's device, and float tensors are
+            assumed to have already been normalized
+
         Returns:
             a list of :class:`fiftyone.core.labels.Label` instances or a list
             of dicts of :class:`fiftyone.core.labels.Label` instances
@@ -348,7 +407,7 @@ class TorchImageModel(
 
     def _predict_all(self, imgs):
         if self._preprocess:
-            imgs = [self._transforms(img) for img in imgs]
+            imgs = self._preprocess_batch(imgs)
 
         if isinstance(imgs, (list, tuple)):
             imgs = torch.stack(imgs)
@@ -357,12 +416,19 @@ class TorchImageModel(
         frame_size = (width, height)
 
         if self._using_gpu:
-            imgs = imgs.cuda()
+            # Asynchronous when `imgs` lives in pinned memory (eg, when it was
+            # emitted by a DataLoader with `pin_memory=True`)
+            imgs = imgs.to(self._device, non_blocking=True)
 
-        if self._using_half_precision:
-            imgs = imgs.half()
+        if imgs.dtype == torch.uint8:
+            # pylint: disable=not-callable
+            imgs = self._normalize(imgs)
 
-        output = self._model(imgs)
+        if self._using_gpu:
+            # Matches the memory format of the model's weights
+            imgs = imgs.contiguous(memory_format=torch.channels_last)
+
+        output = self._forward(imgs)
 
         if self.has_logits:
             self._output_processor.store_logits = self.store_logits
@@ -371,6 +437,95 @@ class TorchImageModel(
             output, frame_size, confidence_thresh=self.config.confidence_thresh
         )
 
+    def _forward(self, imgs):
+        if self._using_cuda_graphs:
+            output = self._forward_cuda_graph(imgs)
+            if output is not None:
+                return output
+
+        with _inference_mode(), _autocast(self._using_half_precision):
+            return self._model(imgs)
+
+    def _forward_cuda_graph(self, imgs):
+        key = (imgs.shape, imgs.dtype)
+
+        if self._cuda_graph_key != key:
+            # The first batch of each new shape is run eagerly, and a graph is
+            # only captured if the next batch has the same shape
+            self._cuda_graph = None
+            self._cuda_graph_key = key
+            return None
+
+        if self._cuda_graph is None:
+            try:
+                self._cuda_graph = self._capture_cuda_graph(imgs)
+            except Exception as e:
+                logger.warning(
+                    "Failed to capture CUDA graph; using eager mode: %s", e
+                )
+                self._using_cuda_graphs = False
+                return None
+
+        graph, static_input, static_output = self._cuda_graph
+
+        # The static tensors are inference tensors, which may only be updated
+        # in inference mode, even when the model is used outside a `with`
+        with _inference_mode():
+            static_input.copy_(imgs)
+            graph.replay()
+
+        return static_output
+
+    def _capture_cuda_graph(self, imgs):
+        static_input = imgs.clone()
+
+        # Warmup iterations must be run on a side stream prior to capture
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream):
+            for _ in range(3):
+                with _inference_mode(), _autocast(
+                    self._using_half_precision, cache_enabled=False
+                ):
+                    self._model(static_input)
+
+        torch.cuda.current_stream().wait_stream(stream)
+
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph):
+            with _inference_mode(), _autocast(
+                self._using_half_precision, cache_enabled=False
+            ):
+                static_output = self._model(static_input)
+
+        return graph, static_input, static_output
+
+    def _use_cuda_graphs(self, config):
+        if not config.use_cuda_graphs or not self._using_gpu:
+            return False
+
+        if not hasattr(torch.cuda, "graph"):
+            logger.warning("CUDA graphs require `torch>=1.10`")
+            return False
+
+        if config.embeddings_layer is not None:
+            logger.warning(
+                "CUDA graphs are not compatible with `embeddings_layer`"
+            )
+            return False
+
+        return True
+
+    def _preprocess_batch(self, imgs):
+        if self._transforms_accept_tensors:
+            # Same-size images (eg, video frames) are converted to a single
+            # uint8 tensor and transformed with one call, not per image
+            batch = _to_uint8_batch(imgs)
+            if batch is not None:
+                return self._transforms(batch)
+
+        return [self._transforms(img) for img in imgs]
+
     def _get_class_labels(self, config):
         if config.labels_string:
             return config.labels_string.split(",")
@@ -386,41 +541,58 @@ class TorchImageModel(
 
     def _build_transforms(self, config):
         ragged_batches = True
-        transforms = [ToPILImage()]
+
+        # Converts PIL/numpy (HWC) to uint8 Torch tensor (CHW)
+        transforms = [ToUInt8Tensor()]
+
+        # Resizing is performed on tensors, which avoids PIL round-trips
+        resize_kwargs = {}
+        if _resize_supports_antialias():
+            resize_kwargs["antialias"] = True
 
         if config.image_size:
             ragged_batches = False
-            transforms.append(torchvision.transforms.Resize(config.image_size))
+            transforms.append(
+                torchvision.transforms.Resize(
+                    config.image_size, **resize_kwargs
+                )
+            )
         elif config.image_dim:
-            transforms.append(torchvision.transforms.Resize(config.image_dim))
+            transforms.append(
+                torchvision.transforms.Resize(
+                    config.image_dim, **resize_kwargs
+                )
+            )
         else:
             if config.image_min_size:
-                transforms.append(MinResize(config.image_min_size))
+                transforms.append(
+                    MinResize(config.image_min_size, **resize_kwargs)
+                )
             elif config.image_min_dim:
-                transforms.append(MinResize(config.image_min_dim))
+                transforms.append(
+                    MinResize(config.image_min_dim, **resize_kwargs)
+                )
 
             if config.image_max_size:
-                transforms.append(MaxResize(config.image_max_size))
+                transforms.append(
+                    MaxResize(config.image_max_size, **resize_kwargs)
+                )
             elif config.image_max_dim:
-                transforms.append(MaxResize(config.image_max_dim))
+                transforms.append(
+                    MaxResize(config.image_max_dim, **resize_kwargs)
+                )
 
-        # Converts PIL/numpy (HWC) to Torch tensor (CHW) in [0, 1]
-        transforms.append(torchvision.transforms.ToTensor())
+        transforms = torchvision.transforms.Compose(transforms)
+        return ragged_batches, transforms
 
+    def _build_normalize(self, config):
         if config.image_mean or config.image_std:
             if not config.image_mean or not config.image_std:
                 raise ValueError(
                     "Both `image_mean` and `image_std` must be provided"
                 )
 
-            transforms.append(
-                torchvision.transforms.Normalize(
-                    config.image_mean, config.image_std
-                )
-            )
-
-        transforms = torchvision.transforms.Compose(transforms)
-        return ragged_batches, transforms
+        return UInt8Normalize(mean=config.image_mean, std=config.image_std)
 
     def _load_model(self, config):
         self._download_model(config)
@@ -428,15 +600,44 @@ class TorchImageModel(
         model = self._load_network(config)
 
         model = model.to(self._device)
-        if self._using_half_precision:
-            model = model.half()
+
+        if self._using_gpu:
+            # cuDNN's fastest convolution kernels operate on NHWC tensors
+            model = model.to(memory_format=torch.channels_last)
 
         self._load_state_dict(model, config)
 
         model.train(False)
 
+        if self._using_int8_quantization:
+            model = torch.quantization.quantize_dynamic(
+                model, {torch.nn.Linear, torch.nn.LSTM}, dtype=torch.qint8
+            )
+
+        if config.use_torchscript:
+            model = self._script_model(model, config)
+
         return model
 
+    def _script_model(self, model, config):
+        if config.embeddings_layer is not None:
+            logger.warning(
+                "TorchScript is not compatible with `embeddings_layer`; "
+                "skipping compilation"
+            )
+            return model
+
+        try:
+            model = torch.jit.script(model)
+            return torch.jit.optimize_for_inference(model)
+        except Exception as e:
+            logger.warning(
+                "Failed to compile model via TorchScript; using eager mode "
+                "instead: %s",
+                e,
+            )
+            return model
+
     def _download_model(self, config):
         pass
 
@@ -466,31 +667,107 @@ class ToPILImage(object):
         return F.to_pil_image(img)
 
 
-class MinResize(object):
+class ToUInt8Tensor(object):
+    """Transform that converts a PIL image or ndarray (HWC) to a uint8 Torch
+    tensor (CHW), while also allowing uint8 tensors to passthrough.
+
+    Floating point inputs are assumed to be in ``[0, 1]`` and are converted
+    to uint8 in the same way as
+    :func:`torchvision:torchvision.transforms.functional.to_pil_image`. Other
+    non-uint8 inputs are not supported.
+    """
+
+    def __call__(self, img):
+        if isinstance(img, Image.Image):
+            return F.pil_to_tensor(img)
+
+        if not isinstance(img, torch.Tensor):
+            img = _numpy_to_tensor(img)
+
+        if img.is_floating_point():
+            img = img.mul(255).byte()
+
+        if img.dtype != torch.uint8:
+            raise ValueError(
+                "Unsupported image dtype %s; expected uint8 or floating point "
+                "images" % img.dtype
+            )
+
+        return img
+
+
+class UInt8Normalize(torch.nn.Module):
+    """Transform that converts uint8 tensors to float and optionally
+    normalizes them.
+
+    The conversion to ``[0, 1]`` and the normalization are fused into a
+    single multiply-add, ``x * scale + bias``, whose coefficients are stored
+    as buffers so that they move with the module to the desired device.
+
+    Args:
+        mean (None): an optional sequence of per-channel means in ``[0, 1]``
+        std (None): an optional sequence of per-channel standard deviations
+            in ``[0, 1]``
+    """
+
+    def __init__(self, mean=None, std=None):
+        super().__init__()
+
+        if mean is None:
+            mean = [0.0]
+
+        if std is None:
+            std = [1.0]
+
+        mean = torch.tensor(mean, dtype=torch.float32).view(-1, 1, 1)
+        std = torch.tensor(std, dtype=torch.float32).view(-1, 1, 1)
+
+        # (x / 255 - mean) / std = x * scale + bias
+        self.register_buffer("scale", 1.0 / (255.0 * std))
+        self.register_buffer("bias", -mean / std)
+
+    def forward(self, tensor):
+        return torch.addcmul(self.bias, tensor.float(), self.scale)
+
+
+class MinResize(torch.nn.Module):
     """Transform that resizes the PIL image or torch Tensor, if necessary, so
     that its minimum dimensions are at least the specified size.
 
+    Tensors may contain a batch of images (``[..., H, W]``), in which case a
+    single resize is applied to the entire batch. This transform supports
+    :func:`torch:torch.jit.script` for tensor inputs.
+
     Args:
         min_output_size: desired minimum output dimensions. Can either be a
             ``(min_height, min_width)`` tuple or a single ``min_dim``
         interpolation (None): optional interpolation mode. Passed directly to
-            :func:`torchvision:torchvision.transforms.functional.resize`
+            :func:`torchvision:torchvision.transforms.functional.resize`. The
+            default is bilinear interpolation
+        antialias (True): whether to apply antialiasing. Passed directly to
+            :func:`torchvision:torchvision.transforms.functional.resize`.
+            Ignored if your ``torchvision`` version does not support it
     """
 
-    def __init__(self, min_output_size, interpolation=None):
+    def __init__(self, min_output_size, interpolation=None, antialias=True):
+        super().__init__()
+
         if isinstance(min_output_size, int):
             min_output_size = (min_output_size, min_output_size)
 
-        self.min_output_size = min_output_size
-        self.interpolation = interpolation
+        if interpolation is None:
+            interpolation = _default_interpolation()
 
-        self._kwargs = {}
-        if interpolation is not None:
-            self._kwargs["interpolation"] = interpolation
+        if not _resize_supports_antialias():
+            antialias = None
 
-    def __call__(self, pil_image_or_tensor):
+        self.min_output_size = tuple(min_output_size)
+        self.interpolation = interpolation
+        self.antialias = antialias
+
+    def forward(self, pil_image_or_tensor):
         if isinstance(pil_image_or_tensor, torch.Tensor):
-            h, w = list(pil_image_or_tensor.size())[-2:]
+            h, w = pil_image_or_tensor.shape[-2:]
         else:
             w, h = pil_image_or_tensor.size
 
@@ -500,35 +777,58 @@ class MinResize(object):
             return pil_image_or_tensor
 
         alpha = max(minh / h, minw / w)
-        size = (int(round(alpha * h)), int(round(alpha * w)))
-        return F.resize(pil_image_or_tensor, size, **self._kwargs)
+        size = [int(round(alpha * h)), int(round(alpha * w))]
+        if self.antialias is None:
+            return F.resize(
+                pil_image_or_tensor, size, interpolation=self.interpolation
+            )
+
+        return F.resize(
+            pil_image_or_tensor,
+            size,
+            interpolation=self.interpolation,
+            antialias=self.antialias,
+        )
 
 
-class MaxResize(object):
+class MaxResize(torch.nn.Module):
     """Transform that resizes the PIL image or torch Tensor, if necessary, so
     that its maximum dimensions are at most the specified size.
 
+    Tensors may contain a batch of images (``[..., H, W]``), in which case a
+    single resize is applied to the entire batch. This transform supports
+    :func:`torch:torch.jit.script` for tensor inputs.
+
     Args:
         max_output_size: desired maximum output dimensions. Can either be a
             ``(max_height, max_width)`` tuple or a single ``max_dim``
         interpolation (None): optional interpolation mode. Passed directly to
-            :func:`torchvision:torchvision.transforms.functional.resize`
+            :func:`torchvision:torchvision.transforms.functional.resize`. The
+            default is bilinear interpolation
+        antialias (True): whether to apply antialiasing. Passed directly to
+            :func:`torchvision:torchvision.transforms.functional.resize`.
+            Ignored if your ``torchvision`` version does not support it
     """
 
-    def __init__(self, max_output_size, interpolation=None):
+    def __init__(self, max_output_size, interpolation=None, antialias=True):
+        super().__init__()
+
         if isinstance(max_output_size, int):
             max_output_size = (max_output_size, max_output_size)
 
-        self.max_output_size = max_output_size
-        self.interpolation = interpolation
+        if interpolation is None:
+            interpolation = _default_interpolation()
+
+        if not _resize_supports_antialias():
+            antialias = None
 
-        self._kwargs = {}
-        if interpolation is not None:
-            self._kwargs["interpolation"] = interpolation
+        self.max_output_size = tuple(max_output_size)
+        self.interpolation = interpolation
+        self.antialias = antialias
 
-    def __call__(self, pil_image_or_tensor):
+    def forward(self, pil_image_or_tensor):
         if isinstance(pil_image_or_tensor, torch.Tensor):
-            h, w = list(pil_image_or_tensor.size())[-2:]
+            h, w = pil_image_or_tensor.shape[-2:]
         else:
             w, h = pil_image_or_tensor.size
 
@@ -538,8 +838,18 @@ class MaxResize(object):
             return pil_image_or_tensor
 
         alpha = min(maxh / h, maxw / w)
-        size = (int(round(alpha * h)), int(round(alpha * w)))
-        return F.resize(pil_image_or_tensor, size, **self._kwargs)
+        size = [int(round(alpha * h)), int(round(alpha * w))]
+        if self.antialias is None:
+            return F.resize(
+                pil_image_or_tensor, size, interpolation=self.interpolation
+            )
+
+        return F.resize(
+            pil_image_or_tensor,
+            size,
+            interpolation=self.interpolation,
+            antialias=self.antialias,
+        )
 
 
 class SaveLayerTensor(object):
@@ -630,14 +940,17 @@ class ClassifierOutputProcessor(OutputProcessor):
         if isinstance(output, dict):
             output = output["logits"]
 
-        logits = output.detach().cpu().numpy()
+        output = output.detach()
 
-        predictions = np.argmax(logits, axis=1)
-        odds = np.exp(logits)
-        odds /= np.sum(odds, axis=1, keepdims=True)
-        scores = np.max(odds, axis=1)
+        # Only the per-image scores and predictions are copied off the device
+        probs = torch.softmax(output, dim=1, dtype=torch.float32)
+        scores, predictions = probs.max(dim=1)
+        scores = scores.cpu().numpy()
+        predictions = predictions.cpu().numpy()
 
-        if not self.store_logits:
+        if self.store_logits:
+            logits = output.cpu().numpy()
+        else:
             logits = itertools.repeat(None)
 
         preds = []
@@ -691,32 +1004,22 @@ class DetectorOutputProcessor(OutputProcessor):
         ]
 
     def _parse_output(self, output, frame_size, confidence_thresh):
-        width, height = frame_size
-
-        boxes = output["boxes"].detach().cpu().numpy()
-        labels = output["labels"].detach().cpu().numpy()
-        scores = output["scores"].detach().cpu().numpy()
-
-        detections = []
-        for box, label, score in zip(boxes, labels, scores):
-            if confidence_thresh is not None and score < confidence_thresh:
-                continue
-
-            x1, y1, x2, y2 = box
-            bounding_box = [
-                x1 / width,
-                y1 / height,
-                (x2 - x1) / width,
-                (y2 - y1) / height,
-            ]
-
-            detections.append(
-                fol.Detection(
-                    label=self.class_labels[label],
-                    bounding_box=bounding_box,
-                    confidence=score,
-                )
+        boxes, labels, scores = _filter_detections(
+            output, ("boxes", "labels", "scores"), confidence_thresh
+        )
+        bboxes = _to_relative_boxes(boxes, frame_size)
+
+        # Native Python types are used to avoid per-element numpy scalars
+        detections = [
+            fol.Detection(
+                label=self.class_labels[label],
+                bounding_box=bounding_box,
+                confidence=score,
             )
+            for bounding_box, label, score in zip(
+                bboxes.tolist(), labels.tolist(), scores.tolist()
+            )
+        ]
 
         return fol.Detections(detections=detections)
 
@@ -761,31 +1064,29 @@ class InstanceSegmenterOutputProcessor(OutputProcessor):
         ]
 
     def _parse_output(self, output, frame_size, confidence_thresh):
-        width, height = frame_size
+        boxes, labels, scores = _filter_detections(
+            output, ("boxes", "labels", "scores"), confidence_thresh
+        )
+        bboxes = _to_relative_boxes(boxes, frame_size)
 
-        boxes = output["boxes"].detach().cpu().numpy()
-        labels = output["labels"].detach().cpu().numpy()
-        scores = output["scores"].detach().cpu().numpy()
-        masks = output["masks"].detach().cpu().numpy()
+        # Masks are thresholded on-device, and only the bounding box region
+        # of each mask is copied to the host
+        masks = output["masks"].detach()
+        if confidence_thresh is not None:
+            masks = masks[output["scores"] >= confidence_thresh]
 
-        detections = []
-        for box, label, score, soft_mask in zip(boxes, labels, scores, masks):
-            if confidence_thresh is not None and score < confidence_thresh:
-                continue
+        masks = masks[:, 0] > self.mask_thresh
 
+        detections = []
+        for box, bounding_box, label, score, mask in zip(
+            boxes, bboxes.tolist(), labels.tolist(), scores.tolist(), masks
+        ):
             x1, y1, x2, y2 = box
-            bounding_box = [
-                x1 / width,
-                y1 / height,
-                (x2 - x1) / width,
-                (y2 - y1) / height,
-            ]
-
-            soft_mask = np.squeeze(soft_mask, axis=0)[
+            mask = mask[
                 int(round(y1)) : int(round(y2)),
                 int(round(x1)) : int(round(x2)),
             ]
-            mask = soft_mask > self.mask_thresh
+            mask = mask.cpu().numpy()
 
             detections.append(
                 fol.Detection(
@@ -841,28 +1142,22 @@ class KeypointDetectorOutputProcessor(OutputProcessor):
     def _parse_output(self, output, frame_size, confidence_thresh):
         width, height = frame_size
 
-        boxes = output["boxes"].detach().cpu().numpy()
-        labels = output["labels"].detach().cpu().numpy()
-        scores = output["scores"].detach().cpu().numpy()
-        keypoints = output["keypoints"].detach().cpu().numpy()
+        boxes, labels, scores, keypoints = _filter_detections(
+            output,
+            ("boxes", "labels", "scores", "keypoints"),
+            confidence_thresh,
+        )
+        bboxes = _to_relative_boxes(boxes, frame_size)
+
+        # Relative `(x, y)` coordinates of all keypoints of all detections
+        points_list = (keypoints[..., :2] / (width, height)).tolist()
 
         _detections = []
         _keypoints = []
         _polylines = []
-        for box, label, score, kpts in zip(boxes, labels, scores, keypoints):
-            if confidence_thresh is not None and score < confidence_thresh:
-                continue
-
-            x1, y1, x2, y2 = box
-            bounding_box = [
-                x1 / width,
-                y1 / height,
-                (x2 - x1) / width,
-                (y2 - y1) / height,
-            ]
-
-            points = [(p[0] / width, p[1] / height) for p in kpts]
-
+        for bounding_box, label, score, points in zip(
+            bboxes.tolist(), labels.tolist(), scores.tolist(), points_list
+        ):
             _detections.append(
                 fol.Detection(
                     label=self.class_labels[label],
@@ -925,15 +1220,53 @@ class SegmenterOutputProcessor(OutputProcessor):
         Returns:
             a list of :class:`fiftyone.core.labels.Segmentation` instances
         """
-        probs = output["out"].detach().cpu().numpy()
-        masks = probs.argmax(axis=1)
+        probs = output["out"].detach()
+
+        # The argmax is computed on-device so that only the `[N, H, W]` masks,
+        # rather than the `[N, M, H, W]` probabilities, are copied to the host
+        masks = probs.argmax(dim=1)
+        if probs.shape[1] <= 256:
+            masks = masks.to(torch.uint8)
+
+        masks = masks.cpu().numpy()
         return [fol.Segmentation(mask=mask) for mask in masks]
 
 
-def recommend_num_workers():
+def _filter_detections(output, keys, confidence_thresh):
+    # Thresholding is performed before copying to the host so that only the
+    # retained detections are transferred
+    values = [output[key].detach() for key in keys]
+
+    if confidence_thresh is not None:
+        keep = output["scores"] >= confidence_thresh
+        values = [v[keep] for v in values]
+
+    return [v.cpu().numpy() for v in values]
+
+
+def _to_relative_boxes(boxes, frame_size):
+    # Converts `[x1, y1, x2, y2]` absolute boxes to `[x, y, w, h]` relative
+    # boxes, for all boxes at once
+    width, height = frame_size
+
+    bboxes = np.empty(boxes.shape, dtype=float)
+    bboxes[:, :2] = boxes[:, :2]
+    bboxes[:, 2:] = boxes[:, 2:] - boxes[:, :2]
+    bboxes /= (width, height, width, height)
+
+    return bboxes
+
+
+def recommend_num_workers(pin_memory=False):
     """Recommend a number of workers for running a
     :class:`torch:torch.utils.data.DataLoader`.
 
+    At most 8 workers are recommended, or 4 workers on Linux when
+    ``pin_memory`` is True.
+
+    Args:
+        pin_memory (False): whether the data loader will use pinned memory
+
     Returns:
         the recommended number of workers
     """
@@ -950,8 +1283,17 @@ def recommend_num_workers():
         # https://github.com/pytorch/pytorch/issues/46409
         return 0
 
+    if pin_memory and sys.platform.startswith("linux"):
+        # On Linux, many workers feeding the single pin memory thread tend to
+        # saturate it and leave the CPU spinning rather than improve throughput
+        max_workers = 4
+    else:
+        # Beyond this, additional workers rarely improve throughput and only
+        # add startup overhead
+        max_workers = 8
+
     try:
-        return multiprocessing.cpu_count() // 2
+        return min(multiprocessing.cpu_count() // 2, max_workers)
     except:
         return 4
 
@@ -978,7 +1320,8 @@ class TorchImageDataset(Dataset):
 
     By default, this class will load images in PIL format and emit Torch
     tensors, but you can use numpy images/tensors instead by passing
-    ``use_numpy = True``.
+    ``use_numpy = True``, or load images directly as uint8 Torch tensors by
+    passing ``use_tensors = True``.
 
     Args:
         image_paths (None): an iterable of image paths
@@ -993,6 +1336,11 @@ class TorchImageDataset(Dataset):
             transform
         use_numpy (False): whether to use numpy arrays rather than PIL images
             and Torch tensors when loading data
+        use_tensors (False): whether to decode images directly into uint8
+            Torch tensors (CHW) via :mod:`torchvision:torchvision.io` rather
+            than loading PIL images. Only applicable when
+            ``use_numpy == False``, and the provided ``transform`` must
+            support tensor inputs
         force_rgb (False): whether to force convert the images to RGB
         skip_failures (False): whether to return an ``Exception`` object rather
             than raising it if an error occurs while loading a sample
@@ -1006,6 +1354,7 @@ class TorchImageDataset(Dataset):
         include_ids=False,
         transform=None,
         use_numpy=False,
+        use_tensors=False,
         force_rgb=False,
         skip_failures=False,
     ):
@@ -1021,6 +1370,7 @@ class TorchImageDataset(Dataset):
         self.transform = transform
         self.force_rgb = force_rgb
         self.use_numpy = use_numpy
+        self.use_tensors = use_tensors
         self.skip_failures = skip_failures
 
     def __len__(self):
@@ -1030,7 +1380,12 @@ class TorchImageDataset(Dataset):
         try:
             image_path = self.image_paths[idx].decode()
 
-            img = _load_image(image_path, self.use_numpy, self.force_rgb)
+            img = _load_image(
+                image_path,
+                self.use_numpy,
+                self.force_rgb,
+                use_tensors=self.use_tensors,
+            )
 
             if self.transform is not None:
                 img = self.transform(img)
@@ -1087,7 +1442,8 @@ class TorchImageClassificationDataset(Dataset):
 
     By default, this class will load images in PIL format and emit Torch
     tensors, but you can use numpy images/tensors instead by passing
-    ``use_numpy = True``.
+    ``use_numpy = True``, or load images directly as uint8 Torch tensors by
+    passing ``use_tensors = True``.
 
     Args:
         image_paths (None): an iterable of image paths
@@ -1104,6 +1460,11 @@ class TorchImageClassificationDataset(Dataset):
             transform
         use_numpy (False): whether to use numpy arrays rather than PIL images
             and Torch tensors when loading data
+        use_tensors (False): whether to decode images directly into uint8
+            Torch tensors (CHW) via :mod:`torchvision:torchvision.io` rather
+            than loading PIL images. Only applicable when
+            ``use_numpy == False``, and the provided ``transform`` must
+            support tensor inputs
         force_rgb (False): whether to force convert the images to RGB
         skip_failures (False): whether to return an ``Exception`` object rather
             than raising it if an error occurs while loading a sample
@@ -1118,6 +1479,7 @@ class TorchImageClassificationDataset(Dataset):
         include_ids=False,
         transform=None,
         use_numpy=False,
+        use_tensors=False,
         force_rgb=False,
         skip_failures=False,
     ):
@@ -1134,6 +1496,7 @@ class TorchImageClassificationDataset(Dataset):
         self.sample_ids = sample_ids
         self.transform = transform
         self.use_numpy = use_numpy
+        self.use_tensors = use_tensors
         self.force_rgb = force_rgb
         self.skip_failures = skip_failures
 
@@ -1145,7 +1508,12 @@ class TorchImageClassificationDataset(Dataset):
     def __getitem__(self, idx):
         try:
             image_path = self.image_paths[idx].decode()
-            img = _load_image(image_path, self.use_numpy, self.force_rgb)
+            img = _load_image(
+                image_path,
+                self.use_numpy,
+                self.force_rgb,
+                use_tensors=self.use_tensors,
+            )
 
             target = self.targets[idx]
             if self._str_targets:
@@ -1222,7 +1590,8 @@ class TorchImagePatchesDataset(Dataset):
 
     By default, this class will load images in PIL format and emit Torch
     tensors, but you can use numpy images/tensors instead by passing
-    ``use_numpy = True``.
+    ``use_numpy = True``, or pass uint8 Torch tensors to ``transform`` by
+    passing ``use_tensors = True``.
 
     If ``ragged_batches = False`` (the default), this class will emit tensors
     containing the stacked (along axis 0) patches from each image.  In this
@@ -1265,6 +1634,10 @@ class TorchImagePatchesDataset(Dataset):
             tensors of different dimensions and thus cannot be stacked
         use_numpy (False): whether to use numpy arrays rather than PIL images
             and Torch tensors when loading data
+        use_tensors (False): whether to pass image patches to ``transform``
+            as uint8 Torch tensors (CHW) rather than PIL images. Only
+            applicable when ``use_numpy == False``, and the provided
+            ``transform`` must support tensor inputs
         force_rgb (False): whether to force convert the images to RGB
         force_square (False): whether to minimally manipulate the patch
             bounding boxes into squares prior to extraction
@@ -1290,6 +1663,7 @@ class TorchImagePatchesDataset(Dataset):
         include_ids=False,
         ragged_batches=False,
         use_numpy=False,
+        use_tensors=False,
         force_rgb=False,
         force_square=False,
         alpha=None,
@@ -1310,13 +1684,17 @@ class TorchImagePatchesDataset(Dataset):
         self.sample_ids = sample_ids
         self.ragged_batches = ragged_batches
         self.use_numpy = use_numpy
+        self.use_tensors = use_tensors
         self.force_rgb = force_rgb
         self.force_square = force_square
         self.alpha = alpha
         self.skip_failures = skip_failures
 
         self._patch_edges = patch_edges
-        self._patches = patches
+
+        # Relative `[x1, y1, x2, y2]` coordinates of all patches, including
+        # any padding, are computed once up front
+        self._patches = _to_patch_coords(patches, alpha)
 
     def __len__(self):
         return len(self.image_paths)
@@ -1351,17 +1729,26 @@ class TorchImagePatchesDataset(Dataset):
 
     def _extract_patches(self, image_path, patches):
         img = _load_image(image_path, True, self.force_rgb)
+        h, w = img.shape[:2]
+
+        boxes = (patches * (w, h, w, h)).astype(int)
 
         img_patches = []
-        for bounding_box in patches:
-            bbox = _to_eta_bbox(bounding_box)
+        for x1, y1, x2, y2 in boxes.tolist():
+            x = slice(x1, x2)
+            y = slice(y1, y2)
 
-            if self.alpha is not None:
-                bbox = bbox.pad_relative(self.alpha)
+            if self.force_square:
+                x, y = _make_square(x, y, w, h)
 
-            img_patch = bbox.extract_from(img, force_square=self.force_square)
+            img_patch = img[y, x, ...]
 
-            if not self.use_numpy:
+            if self.use_numpy:
+                pass
+            elif self.use_tensors:
+                # Avoids a round-trip through PIL
+                img_patch = _numpy_to_tensor(img_patch)
+            else:
                 img_patch = Image.fromarray(img_patch)
 
             if self.transform is not None:
@@ -1474,14 +1861,46 @@ class TorchImagePatchesDataset(Dataset):
             patches.extend(boxes)
 
         patch_edges = np.array(patch_edges)
-        patches = np.array(patches)
+        patches = np.array(patches, dtype=float).reshape(-1, 4)
 
         return image_paths, sample_ids, patch_edges, patches
 
 
-def _to_eta_bbox(bounding_box):
-    tlx, tly, w, h = bounding_box
-    return etag.BoundingBox.from_coords(tlx, tly, tlx + w, tly + h)
+def _to_patch_coords(bboxes, alpha):
+    # Converts `[x, y, w, h]` relative boxes to `[x1, y1, x2, y2]` relative
+    # coordinates clamped to `[0, 1]`, applying the optional padding
+    coords = np.empty(bboxes.shape, dtype=float)
+    coords[:, :2] = bboxes[:, :2]
+    coords[:, 2:] = bboxes[:, :2] + bboxes[:, 2:]
+    np.clip(coords, 0, 1, out=coords)
+
+    if alpha is not None:
+        pad = 0.5 * max(alpha, -1) * (coords[:, 2:] - coords[:, :2])
+        coords[:, :2] -= pad
+        coords[:, 2:] += pad
+        np.clip(coords, 0, 1, out=coords)
+
+    return coords
+
+
+def _make_square(x, y, w, h):
+    # Minimally expands the smaller dimension of the `x` and `y` slices so that
+    # they define a square, contracting the larger dimension if necessary to
+    # fit within a `w x h` image
+    ws = x.stop - x.start
+    hs = y.stop - y.start
+    dx = hs - ws
+    if dx < 0:
+        return _make_square(y, x, h, w)[::-1]
+
+    def pad(z, dz, zmax):
+        dz1 = int(0.5 * dz)
+        dz2 = dz - dz1
+        ddz = max(0, dz1 - z.start) - max(0, z.stop + dz2 - zmax)
+        return slice(z.start - dz1 + ddz, z.stop + dz2 + ddz)
+
+    dy = min(0, w - dx - ws)
+    return pad(x, dx + dy, w), pad(y, dy, h)
 
 
 def _polylines_to_bboxes(points):
@@ -1528,14 +1947,110 @@ def from_image_classification_dir_tree(dataset_dir):
     return torchvision.datasets.ImageFolder(dataset_dir)
 
 
-def _load_image(image_path, use_numpy, force_rgb):
+def _inference_mode():
+    # `torch.inference_mode()` is a lighter-weight `torch.no_grad()` that is
+    # only available in `torch>=1.9`
+    if hasattr(torch, "inference_mode"):
+        return torch.inference_mode()
+
+    return torch.no_grad()
+
+
+def _autocast(enabled, cache_enabled=True):
+    # Runs ops in float16 where it is safe to do so and float32 elsewhere
+    # (eg, softmax and normalization layers). Weight cast caching must be
+    # disabled when capturing CUDA graphs
+    if hasattr(torch, "autocast"):
+        return torch.autocast(
+            "cuda",
+            dtype=torch.float16,
+            enabled=enabled,
+            cache_enabled=cache_enabled,
+        )
+
+    return torch.cuda.amp.autocast(enabled=enabled)
+
+
+def _default_interpolation():
+    # `InterpolationMode` was added in `torchvision==0.9`
+    if hasattr(F, "InterpolationMode"):
+        return F.InterpolationMode.BILINEAR
+
+    # pylint: disable=no-member
+    return Image.BILINEAR
+
+
+def _resize_supports_antialias():
+    # `antialias` was added to `resize()` in `torchvision==0.10`
+    return "antialias" in inspect.signature(F.resize).parameters
+
+
+def _to_uint8_batch(imgs):
+    # Converts a batch of same-size images to a uint8 tensor (NCHW), or
+    # returns None if the images cannot be stacked
+    if isinstance(imgs, torch.Tensor):
+        return imgs if imgs.ndim == 4 else None
+
+    if isinstance(imgs, np.ndarray):
+        imgs = torch.from_numpy(np.ascontiguousarray(imgs))
+        return imgs.permute(0, 3, 1, 2) if imgs.ndim == 4 else None
+
+    if not imgs:
+        return None
+
+    if all(isinstance(img, torch.Tensor) for img in imgs):
+        if len(set(img.shape for img in imgs)) != 1 or imgs[0].ndim != 3:
+            return None
+
+        return torch.stack(imgs)
+
+    if all(isinstance(img, np.ndarray) for img in imgs):
+        if len(set(img.shape for img in imgs)) != 1 or imgs[0].ndim != 3:
+            return None
+
+        return _to_uint8_batch(np.stack(imgs))
+
+    return None
+
+
+def _numpy_to_tensor(img):
+    # Converts a uint8 HWC array to a uint8 CHW tensor
+    if img.ndim == 2:
+        img = img[:, :, np.newaxis]
+
+    return torch.from_numpy(np.ascontiguousarray(img)).permute(2, 0, 1)
+
+
+def _load_image(image_path, use_numpy, force_rgb, use_tensors=False):
     if use_numpy:
         # pylint: disable=no-member
         flag = cv2.IMREAD_COLOR if force_rgb else cv2.IMREAD_UNCHANGED
         return etai.read(image_path, flag=flag)
 
+    if use_tensors:
+        # Decodes JPEG/PNG images directly into tensors without going through
+        # PIL. Other formats, and images that do not decode to uint8 (eg,
+        # 16-bit PNGs), fall back to PIL below
+        if force_rgb:
+            mode = torchvision.io.ImageReadMode.RGB
+        else:
+            mode = torchvision.io.ImageReadMode.UNCHANGED
+
+        try:
+            img = torchvision.io.read_image(image_path, mode=mode)
+        except RuntimeError:
+            img = None
+
+        if img is not None and img.dtype == torch.uint8:
+            return img
+
+    # Note that installing `Pillow-SIMD` as a drop-in replacement for `Pillow`
+    # can greatly speed up this step
     img = Image.open(image_path)
     if force_rgb:
         img = img.convert("RGB")
 
+    if use_tensors:
+        return F.pil_to_tensor(img)
+
     return img
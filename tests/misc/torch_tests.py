@@ -5,12 +5,19 @@ Tests for the :mod:`fiftyone.utils.torch` module.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import os
 import unittest
 
+import cv2
 import numpy as np
 from PIL import Image
+import pytest
 import torch
 import torchvision
+from torchvision.transforms import functional as F
+
+import eta.core.geometry as etag
+import eta.core.utils as etau
 
 import fiftyone as fo
 import fiftyone.utils.torch as fout
@@ -51,6 +58,392 @@ def test_torch_max_size():
     assert result.size == (200, 200)
 
 
+_IMAGENET_MEAN = [0.485, 0.456, 0.406]
+_IMAGENET_STD = [0.229, 0.224, 0.225]
+
+
+def test_torch_uint8_preprocessing():
+    # The uint8 pipeline must match the PIL-based pipeline that it replaced
+    old_transforms = torchvision.transforms.Compose(
+        [
+            fout.ToPILImage(),
+            torchvision.transforms.ToTensor(),
+            torchvision.transforms.Normalize(_IMAGENET_MEAN, _IMAGENET_STD),
+        ]
+    )
+    to_uint8 = fout.ToUInt8Tensor()
+    normalize = fout.UInt8Normalize(_IMAGENET_MEAN, _IMAGENET_STD)
+
+    array = np.random.randint(255, size=(48, 64, 3), dtype=np.uint8)
+    tensor = torch.rand(3, 48, 64)
+    imgs = [Image.fromarray(array), array, tensor]
+
+    for img in imgs:
+        expected = old_transforms(img)
+        actual = normalize(to_uint8(img))
+        assert actual.dtype == torch.float32
+        assert actual.shape == expected.shape
+        assert torch.allclose(actual, expected, atol=1e-5)
+
+    # Float inputs are converted to uint8 prior to normalization
+    assert to_uint8(tensor).dtype == torch.uint8
+    assert to_uint8(array.astype(np.float32) / 255.0).dtype == torch.uint8
+
+    # Other dtypes cannot be converted unambiguously
+    for img in (array.astype(np.int32), tensor.to(torch.int32)):
+        with pytest.raises(ValueError):
+            to_uint8(img)
+
+
+def test_torch_detection_outputs():
+    output = {
+        "boxes": torch.tensor(
+            [[10.0, 20.0, 50.0, 80.0], [0.0, 0.0, 200.0, 100.0]]
+        ),
+        "labels": torch.tensor([1, 2]),
+        "scores": torch.tensor([0.9, 0.3]),
+    }
+    keys = ("boxes", "labels", "scores")
+
+    boxes, labels, scores = fout._filter_detections(output, keys, None)
+    assert isinstance(boxes, np.ndarray)
+    assert boxes.shape == (2, 4)
+    assert labels.tolist() == [1, 2]
+
+    boxes, labels, scores = fout._filter_detections(output, keys, 0.5)
+    assert boxes.shape == (1, 4)
+    assert labels.tolist() == [1]
+    assert np.allclose(scores, [0.9])
+
+    boxes, _, _ = fout._filter_detections(output, keys, 0.95)
+    assert boxes.shape == (0, 4)
+    assert fout._to_relative_boxes(boxes, (200, 100)).shape == (0, 4)
+
+    boxes = output["boxes"].numpy()
+    bboxes = fout._to_relative_boxes(boxes, (200, 100))
+    for box, bbox in zip(boxes, bboxes):
+        x1, y1, x2, y2 = box
+        expected = [x1 / 200, y1 / 100, (x2 - x1) / 200, (y2 - y1) / 100]
+        assert np.allclose(bbox, expected)
+
+
+def test_torch_uint8_batch():
+    arrays = [
+        np.random.randint(255, size=(32, 48, 3), dtype=np.uint8)
+        for _ in range(4)
+    ]
+    tensors = [fout.ToUInt8Tensor()(a) for a in arrays]
+    expected = torch.stack(tensors)
+
+    assert torch.equal(fout._to_uint8_batch(arrays), expected)
+    assert torch.equal(fout._to_uint8_batch(np.stack(arrays)), expected)
+    assert torch.equal(fout._to_uint8_batch(tensors), expected)
+    assert torch.equal(fout._to_uint8_batch(expected), expected)
+
+    # Ragged, mixed, PIL and empty inputs must be transformed individually
+    ragged = arrays[:2] + [np.zeros((16, 16, 3), dtype=np.uint8)]
+    assert fout._to_uint8_batch(ragged) is None
+    assert fout._to_uint8_batch([arrays[0], tensors[1]]) is None
+    assert fout._to_uint8_batch([Image.fromarray(arrays[0])]) is None
+    assert fout._to_uint8_batch([]) is None
+
+    # Batched transforms must match per-image transforms
+    transforms = torchvision.transforms.Compose(
+        [fout.ToUInt8Tensor(), fout.MinResize(64)]
+    )
+    batch = transforms(fout._to_uint8_batch(arrays))
+    for img, actual in zip(arrays, batch):
+        assert torch.equal(actual, transforms(img))
+
+
+def test_torch_patch_coords():
+    bboxes = np.array([[0.1, 0.2, 0.4, 0.4], [-0.2, 0.5, 0.5, 0.8]])
+
+    coords = fout._to_patch_coords(bboxes, None)
+    assert np.allclose(coords, [[0.1, 0.2, 0.5, 0.6], [0, 0.5, 0.3, 1]])
+
+    coords = fout._to_patch_coords(bboxes, 0.5)
+    assert np.allclose(coords[0], [0, 0.1, 0.6, 0.7])
+
+    coords = fout._to_patch_coords(bboxes, 1)
+    assert np.allclose(coords[1], [0, 0.25, 0.45, 1])
+
+    coords = fout._to_patch_coords(bboxes, -0.5)
+    assert np.allclose(coords[0], [0.2, 0.3, 0.4, 0.5])
+
+    # alpha < -1 is treated as -1
+    coords = fout._to_patch_coords(bboxes, -2)
+    assert np.allclose(coords[0], [0.3, 0.4, 0.3, 0.4])
+
+    # Wide box: the height is expanded
+    x, y = fout._make_square(slice(10, 30), slice(10, 20), 100, 50)
+    assert (x, y) == (slice(10, 30), slice(5, 25))
+
+    # Expansion is shifted to stay within the image
+    x, y = fout._make_square(slice(10, 30), slice(0, 10), 100, 50)
+    assert (x, y) == (slice(10, 30), slice(0, 20))
+
+    # Tall box: the width is expanded
+    x, y = fout._make_square(slice(0, 10), slice(10, 30), 50, 100)
+    assert (x, y) == (slice(0, 20), slice(10, 30))
+
+    # Box wider than the image is tall: the width is contracted
+    x, y = fout._make_square(slice(0, 60), slice(0, 20), 100, 20)
+    assert (x, y) == (slice(20, 40), slice(0, 20))
+
+
+def test_torch_patch_coords_eta():
+    # Patch extraction must match the `eta` implementation that it replaced
+    img = np.random.randint(255, size=(97, 131, 3), dtype=np.uint8)
+    h, w = img.shape[:2]
+
+    bboxes = np.concatenate(
+        [
+            np.random.uniform(-0.1, 1, size=(100, 2)),
+            np.random.uniform(0, 0.8, size=(100, 2)),
+        ],
+        axis=1,
+    )
+
+    for alpha in (None, 0.3, -0.5, -2):
+        coords = fout._to_patch_coords(bboxes, alpha)
+        boxes = (coords * (w, h, w, h)).astype(int)
+        for force_square in (False, True):
+            for bbox, box in zip(bboxes, boxes.tolist()):
+                x1, y1, x2, y2 = box
+                x, y = slice(x1, x2), slice(y1, y2)
+                if force_square:
+                    x, y = fout._make_square(x, y, w, h)
+
+                bb = etag.BoundingBox.from_coords(
+                    bbox[0], bbox[1], bbox[0] + bbox[2], bbox[1] + bbox[3]
+                )
+                if alpha is not None:
+                    bb = bb.pad_relative(alpha)
+
+                expected = bb.extract_from(img, force_square=force_square)
+                assert np.array_equal(img[y, x], expected)
+
+
+def test_torch_resize_tensors():
+    imgs = torch.randint(255, size=(4, 3, 100, 150), dtype=torch.uint8)
+
+    transf = fout.MinResize(224)
+    result = transf(imgs)
+    assert result.shape == (4, 3, 224, 336)
+    assert torch.equal(result[1], transf(imgs[1]))
+
+    transf = fout.MaxResize((50, 50))
+    result = transf(imgs)
+    assert result.shape == (4, 3, 33, 50)
+    assert torch.equal(result[1], transf(imgs[1]))
+
+    # No-op resizes return the input
+    assert fout.MinResize(64)(imgs) is imgs
+    assert fout.MaxResize(200)(imgs) is imgs
+
+    transforms = torch.nn.Sequential(
+        fout.MinResize(224), fout.MaxResize((300, 300))
+    )
+    scripted = torch.jit.script(transforms)
+    expected = transforms(imgs)
+    assert expected.shape == (4, 3, 200, 300)
+    assert torch.equal(scripted(imgs), expected)
+
+
+def test_torch_uint8_normalize():
+    imgs = torch.randint(256, size=(4, 3, 32, 48), dtype=torch.uint8)
+
+    to_tensor = torchvision.transforms.ToTensor()
+    normalize = torchvision.transforms.Normalize(_IMAGENET_MEAN, _IMAGENET_STD)
+    expected = torch.stack(
+        [normalize(to_tensor(img.permute(1, 2, 0).numpy())) for img in imgs]
+    )
+
+    transf = fout.UInt8Normalize(_IMAGENET_MEAN, _IMAGENET_STD)
+    result = transf(imgs)
+    assert result.dtype == torch.float32
+    assert torch.allclose(result, expected, atol=1e-6)
+
+    # Without mean/std, inputs are only scaled to [0, 1]
+    result = fout.UInt8Normalize()(imgs)
+    assert torch.allclose(result, imgs.float() / 255, atol=1e-6)
+
+    # The coefficients move with the module
+    buffers = dict(transf.named_buffers())
+    assert set(buffers.keys()) == {"scale", "bias"}
+
+
+def test_torch_load_image_tensors():
+    array = np.random.randint(255, size=(24, 32, 3), dtype=np.uint8)
+
+    with etau.TempDir() as tmp_dir:
+        png_path = os.path.join(tmp_dir, "image.png")
+        png16_path = os.path.join(tmp_dir, "image16.png")
+        bmp_path = os.path.join(tmp_dir, "image.bmp")
+
+        Image.fromarray(array).save(png_path)
+        Image.fromarray(array).save(bmp_path)
+
+        # 16-bit images decode to uint16 tensors, so they must fall back to
+        # PIL, which converts them to 8-bit RGB
+        # pylint: disable=no-member
+        cv2.imwrite(png16_path, 257 * array[:, :, ::-1].astype(np.uint16))
+
+        for image_path in (png_path, png16_path, bmp_path):
+            img = fout._load_image(image_path, False, True, use_tensors=True)
+            expected = fout._load_image(image_path, False, True)
+
+            assert img.dtype == torch.uint8
+            assert img.shape == (3, 24, 32)
+            assert torch.equal(img, F.pil_to_tensor(expected))
+
+
+def _make_fake_detections(num, width, height, num_keypoints=None):
+    x1 = np.random.uniform(0, 0.5 * width, size=num)
+    y1 = np.random.uniform(0, 0.5 * height, size=num)
+    x2 = x1 + np.random.uniform(1, 0.5 * width, size=num)
+    y2 = y1 + np.random.uniform(1, 0.5 * height, size=num)
+
+    output = {
+        "boxes": torch.tensor(np.stack([x1, y1, x2, y2], axis=1)).float(),
+        "labels": torch.randint(3, size=(num,)),
+        "scores": torch.tensor([0.9, 0.2, 0.6, 0.4][:num]),
+        "masks": torch.rand(num, 1, height, width),
+    }
+
+    if num_keypoints is not None:
+        output["keypoints"] = torch.rand(num, num_keypoints, 3) * 50
+
+    return output
+
+
+def _to_old_bbox(box, width, height):
+    x1, y1, x2, y2 = box
+    return [x1 / width, y1 / height, (x2 - x1) / width, (y2 - y1) / height]
+
+
+def test_torch_classifier_outputs():
+    logits = torch.randn(4, 5)
+    processor = fout.ClassifierOutputProcessor(
+        ["a", "b", "c", "d", "e"], store_logits=True
+    )
+
+    _logits = logits.numpy()
+    odds = np.exp(_logits)
+    odds /= np.sum(odds, axis=1, keepdims=True)
+    scores = np.max(odds, axis=1)
+    predictions = np.argmax(_logits, axis=1)
+
+    results = processor(logits, None)
+    for result, prediction, score, l in zip(
+        results, predictions, scores, _logits
+    ):
+        assert result.label == processor.class_labels[prediction]
+        assert np.isclose(result.confidence, score)
+        assert np.allclose(result.logits, l)
+
+    thresh = float(np.mean(np.sort(scores)[1:3]))
+    results = processor({"logits": logits}, None, confidence_thresh=thresh)
+    for result, score in zip(results, scores):
+        assert (result is None) == (score < thresh)
+
+
+def test_torch_instance_segmenter_outputs():
+    width, height = 64, 48
+    class_labels = ["a", "b", "c"]
+    processor = fout.InstanceSegmenterOutputProcessor(class_labels)
+    output = _make_fake_detections(4, width, height)
+
+    for confidence_thresh in (None, 0.3, 0.5):
+        (detections,) = processor(
+            [output], (width, height), confidence_thresh=confidence_thresh
+        )
+
+        expected = []
+        for box, label, score, soft_mask in zip(
+            output["boxes"].numpy(),
+            output["labels"].numpy(),
+            output["scores"].numpy(),
+            output["masks"].numpy(),
+        ):
+            if confidence_thresh is not None and score < confidence_thresh:
+                continue
+
+            x1, y1, x2, y2 = box
+            soft_mask = np.squeeze(soft_mask, axis=0)[
+                int(round(y1)) : int(round(y2)),
+                int(round(x1)) : int(round(x2)),
+            ]
+            expected.append((label, score, box, soft_mask > 0.5))
+
+        assert len(detections.detections) == len(expected)
+        for detection, (label, score, box, mask) in zip(
+            detections.detections, expected
+        ):
+            assert detection.label == class_labels[label]
+            assert np.isclose(detection.confidence, score)
+            assert np.allclose(
+                detection.bounding_box, _to_old_bbox(box, width, height)
+            )
+            assert np.array_equal(detection.mask, mask)
+
+    # All detections filtered
+    (detections,) = processor([output], (width, height), confidence_thresh=1)
+    assert len(detections.detections) == 0
+
+
+def test_torch_keypoint_detector_outputs():
+    width, height = 64, 48
+    class_labels = ["a", "b", "c"]
+    edges = [[0, 1], [1, 2, 3]]
+    processor = fout.KeypointDetectorOutputProcessor(class_labels, edges=edges)
+    output = _make_fake_detections(4, width, height, num_keypoints=4)
+
+    for confidence_thresh in (None, 0.5, 1):
+        (label,) = processor(
+            [output], (width, height), confidence_thresh=confidence_thresh
+        )
+
+        expected = []
+        for box, score, kpts in zip(
+            output["boxes"].numpy(),
+            output["scores"].numpy(),
+            output["keypoints"].numpy(),
+        ):
+            if confidence_thresh is not None and score < confidence_thresh:
+                continue
+
+            points = [(p[0] / width, p[1] / height) for p in kpts]
+            expected.append((box, points))
+
+        detections = label["detections"].detections
+        keypoints = label["keypoints"].keypoints
+        polylines = label["polylines"].polylines
+        assert len(detections) == len(keypoints) == len(expected)
+        assert len(polylines) == len(expected)
+
+        for detection, keypoint, polyline, (box, points) in zip(
+            detections, keypoints, polylines, expected
+        ):
+            assert np.allclose(
+                detection.bounding_box, _to_old_bbox(box, width, height)
+            )
+            assert np.allclose(keypoint.points, points)
+            for shape, edge in zip(polyline.points, edges):
+                assert np.allclose(shape, [points[v] for v in edge])
+
+
+def test_torch_segmenter_outputs():
+    processor = fout.SegmenterOutputProcessor(["a", "b", "c"])
+    probs = torch.rand(2, 3, 16, 24)
+
+    results = processor({"out": probs})
+    for result, mask in zip(results, probs.numpy().argmax(axis=1)):
+        assert result.mask.shape == mask.shape
+        assert np.array_equal(result.mask, mask)
+
+
 @unittest.skip("Must be run manually")
 def test_torch_image_patches_dataset():
     image_path = "/path/to/an/image.png"